@@ -280,6 +280,7 @@ class ArgWrapper(object):
         self.owner = owner
         self.arg = argument
         self.var = tk.StringVar()
+        self.var.trace_add('write', lambda *args: owner.dirty.add(self))  # validate changed values only
         self.factory = {bool: self._get_choice_value_widget,
                         FileBase: self._get_file_value_widget,
                         FolderBase: self._get_folder_value_widget,
@@ -298,6 +299,7 @@ class ArgWrapper(object):
         self.var.set(self.arg.encode(value))
 
     def set_value(self, event=None):
+        self.owner.dirty.discard(self)
         try:
             value = self.arg.decode(self.var.get())
             setattr(self.keyword_arguments,
@@ -503,7 +505,8 @@ class CommandFrame(BaseFrame):
     def show_command(self):
         self.command_view.config(state=tk.NORMAL)
         self.command_view.delete(1.0, tk.END)
-        cmd = self.master.command(**self.selected)
+        selected = self.selected
+        cmd = self.master.command(short=selected['short'], path=selected['path'], list=selected['list'])
         if cmd is not None:
             self.command_view.insert(1.0, cmd)
         self.command_view.config(state=tk.DISABLED)
@@ -580,6 +583,7 @@ class ChildParserFrame(BaseParserFrame):
         self.config(highlightbackground="gray",
                     highlightthickness=1)
         self.filename = None
+        self.dirty = set()  # wrappers with values changed since last validation
 
     def create_widgets(self):
         self.form_frame = FormFrame(self)
@@ -597,18 +601,19 @@ class ChildParserFrame(BaseParserFrame):
         return self.command_frame.show_command()
 
     def check(self):
-        self.set_values()
+        self.set_values(force=True)
 
-    def set_values(self):
-        success = True
-        for wrapper in self.form_frame.wrappers:
-            success &= wrapper.set_value()
-        self.command_frame.show_command()
-        return success
+    def set_values(self, force=False):
+        """ validates changed values, or all values if force (e.g. files can have been removed since) """
+        wrappers = self.form_frame.wrappers if force else list(self.dirty)  # set_value() changes self.dirty
+        for wrapper in wrappers:
+            wrapper.set_value()  # also shows the command
+        return all(wrapper.error is None for wrapper in self.form_frame.wrappers)
 
     def get_values(self):
         for wrapper in self.form_frame.wrappers:
             wrapper.get_value()
+        self.dirty.clear()  # values were read from the parser, not edited
         self.command_frame.show_command()
 
     def del_values(self):
@@ -622,18 +627,18 @@ class ChildParserFrame(BaseParserFrame):
     def run(self):
         if self.parser.target is None:
             tk.messagebox.showinfo('nothing to run', 'no runnable target was configured for this app')
-        elif self.set_values():
+        elif self.set_values(force=True):
             RunWindow(parser=self.parser).mainloop()
 
     def save(self):
-        if self.set_values():
+        if self.set_values(force=True):
             if not self.filename:
                 self.save_as()
             else:
                 self.parser.save(self.filename)
 
     def save_as(self):
-        if self.set_values():
+        if self.set_values(force=True):
             self.filename = asksaveasfilename(defaultextension=".cl")
             if self.filename:
                 self.parser.save(self.filename)
@@ -3,11 +3,11 @@ import sys
 
 from inspect import Parameter, signature
 from typing import Callable, Any, Mapping, Tuple
+from weakref import WeakKeyDictionary
 
-from pycicle import cmd_gui
 from pycicle.custom_types import get_type_string
 from pycicle.exceptions import ConfigError, ValidationError
-from pycicle.tools.utils import MISSING, get_entry_file, get_typed_class_attrs, count, cached_property
+from pycicle.tools.utils import MISSING, get_entry_file, get_entry_files, get_typed_class_attrs, cached_property
 from pycicle.tools.parsers import quote_split, quote_join, default_type_codecs
 
 
@@ -17,6 +17,9 @@ class Argument(object):
 
     reserved = {'help', 'gui'}
 
+    __slots__ = ('type', 'flags', 'many', 'default', 'valid', 'help', 'name', 'cls', 'positional',
+                 '_encode_fn', '_decode_fn', '_encode', '_decode', '_setter', '_short_flag', '_long_flag', '_usage', '_option')
+
     @classmethod
     def types(cls):
         return cls.basic_types + tuple(cls.type_codecs)  # keys of type_codecs are classes
@@ -34,6 +37,12 @@ class Argument(object):
         self.help = help
         self.name = None  # set in __set_name__
         self._encode, self._decode = self.type_codecs.get(self.type, (str, self.type))
+        # used by encode() and decode(), selected once on 'many' and 'type'
+        if self.many:
+            self._encode_fn, self._decode_fn = self._encode_many, self._decode_many
+        else:
+            self._encode_fn = self._encode_single
+            self._decode_fn = self._decode if self.type is str else self._decode_single
         self.positional = False  # set by validate_config(); meaning argument CAN be positional
 
     @property
@@ -57,18 +66,17 @@ class Argument(object):
         """ see python descriptor docs for the magic """
         if obj is None:
             return self
-        try:
-            return obj.__arg_values__[self.name]
-        except KeyError:
+        value = obj.__arg_values__.get(self.name, MISSING)  # MISSING is never stored as a value
+        if value is MISSING:
             if self.default is MISSING:
                 raise AttributeError(f"'{self.cls.__name__}' has no attribute value for '{self.name}'")
-            obj.__arg_values__[self.name] = self.default
-            return self.default
+            return self.default  # values of arguments with a default are set in KeywordArguments.__init__
+        return value
 
     def __set__(self, obj, value):
         """ see python descriptor documentation for the magic """
         try:
-            obj.__arg_values__[self.name] = self.validate(value)
+            obj.__arg_values__[self.name] = self._setter(value)
         except (TypeError, ValueError, AttributeError) as error:
             raise ValidationError(f"error in '{self.name}' for value '{value}': {str(error)}")
 
@@ -78,7 +86,7 @@ class Argument(object):
         if self.default is not MISSING:
             obj.__arg_values__[self.name] = self.default
 
-    def validate_config(self, existing):
+    def validate_config(self, used_flags=frozenset(), many_count=0, positional_chain=True):
         """
         Called in __init_subclass__ of owner class because self.name must be set to give clearer error messages and
         python __set_name__ changes all exceptions to (somewhat vague) RuntimeError.
@@ -92,33 +100,55 @@ class Argument(object):
         if self.name.startswith('_'):
             raise ConfigError(f"Argument name '{self.name}' cannot start with an '_' to prevent name conflicts")
 
-        self.flags = self._validate_flags(existing)
-        self.default = self._validate_default(self.default)
+        self.flags = self._validate_flags(used_flags)
+        self._short_flag = min(self.flags, key=len)
+        self._long_flag = max(self.flags, key=len)
+        convert = self._make_converter()
+        self.default = self._validate_default(self.default, convert)
+        self._setter = self._make_setter(convert)
+        self._usage = self._make_usage()
 
-        if count(existing.values(), key=lambda v: v.many) <= 1:
-            if all(e.positional and not e.switch for e in existing.values()):
-                self.positional = True  # this means the argument CAN be positional
+        if many_count <= 1 and positional_chain:  # earlier: at most one with 'many', all positional, no switches
+            self.positional = True  # this means the argument CAN be positional
+        self._option = self._make_option()
 
     def encode(self, value):
         """ creates str version of value, takes 'many' into account """
+        return self._encode_fn(value)
+
+    def decode(self, string_s):
+        """ creates value from str, takes 'many' into account """
+        return self._decode_fn(string_s)
+
+    def _encode_single(self, value):
+        """ creates str version of value """
         if value is None or value is MISSING:
             return ''
-        if self.many:
-            return quote_join(self._encode(v) for v in value)
         return self._encode(value)
 
-    def decode(self, string_s):
-        """ creates value from str, takes 'many' into account """
-        if self.many:
-            if isinstance(string_s, str):
-                string_s = quote_split(string_s)
-            if not len(string_s):
-                return self.default
-            return [self._decode(s) for s in string_s]
-        else:
-            if self.type is not str and string_s == '':
-                return self.default
-            return self._decode(string_s)
+    def _encode_many(self, values):
+        """ creates str version of a list of values """
+        if values is None or values is MISSING:
+            return ''
+        return quote_join(self._encode(v) for v in values)
+
+    def _decode_single(self, string):
+        """ creates value from str, default if string is empty """
+        if string == '':
+            return self.default
+        return self._decode(string)
+
+    def _decode_many(self, string_s):
+        """ creates list of values from str or list of str, default if empty """
+        if isinstance(string_s, str):
+            string_s = quote_split(string_s)
+        return self._decode_list(string_s)
+
+    def _decode_list(self, strings):
+        """ creates list of values from already split strings, default if empty """
+        if not len(strings):
+            return self.default
+        return list(map(self._decode, strings))
 
     def parse_list(self, values):
         """ only used in parser """
@@ -130,9 +160,9 @@ class Argument(object):
             if self.switch:
                 return True
             raise ValidationError(f"missing value for '{self.name}'")
-        return self.decode(values if self.many else values[0])
+        return self.decode(values if self.many else values[0])  # values are already split
 
-    def _validate_flags(self, existing):
+    def _validate_flags(self, used_flags):
         def valid_format(flag):
             flag = flag.strip()
             if flag.startswith('--'):
@@ -146,13 +176,10 @@ class Argument(object):
             return flag
 
         def remove_existing(flags):
-            for arg in existing.values():
-                for flag in flags[:]:
-                    if flag in arg.flags:
-                        flags.remove(flag)
+            flags = [f for f in flags if f not in used_flags]
             if not len(flags):
                 raise ConfigError(f"Argument '{self.name}' has no flags, all configured flags were used by other arguments")
-            return tuple(flags)
+            return tuple(map(sys.intern, flags))  # flags are dict keys in CmdParser._flag_lookup
 
         if self.flags:
             flags = [valid_format(f) for f in self.flags]
@@ -160,38 +187,54 @@ class Argument(object):
             flags = ['--' + self.name, '-' + self.name[0]]
         return remove_existing(flags)
 
-    def _validate(self, value):
+    def _make_converter(self):
+        """ returns a casting (and validating) function specialized on the (fixed) 'many' and 'valid' configuration """
+        name, type_, valid = self.name, self.type, self.valid
+
         def cast(value):
-            return value if type(value) is self.type else self.type(value)
+            return value if type(value) is type_ else type_(value)
 
-        if self.many:
-            value = [cast(v) for v in value]
-        else:
-            value = cast(value)
+        def cast_many(values):
+            return list(map(cast, values))
 
-        if self.valid and not self.valid(value):
-            raise ValueError(f"Invalid value: {str(value)} for argument '{self.name}'")
-        return value
+        convert = cast_many if self.many else cast
+        if valid is None:
+            return convert
+
+        def convert_valid(value):
+            value = convert(value)
+            if not valid(value):
+                raise ValueError(f"Invalid value: {str(value)} for argument '{name}'")
+            return value
+        return convert_valid
+
+    def _make_setter(self, convert):
+        """ returns a validation function that skips conversion of the (already validated) default """
+        name, default = self.name, self.default
+
+        def setter(value):
+            if value is MISSING:
+                raise ValueError(f"error in '{name}': missing required value")
+            if value is default:
+                return value
+            return convert(value)
+        return setter
 
     def validate(self, value):
         """ performs validation and decoding of argument values """
-        if value is MISSING:
-            raise ValueError(f"error in '{self.name}': missing required value")
-        if value is self.default:
-            return value
-        return self._validate(value)
+        return self._setter(value)
 
-    def _validate_default(self, value):
+    def _validate_default(self, value, convert):
         if value is None or value is MISSING:
             return value
         try:
-            return self._validate(value)
+            return convert(value)
         except (TypeError, ValueError, AttributeError) as error:
             raise ConfigError(f"error in '{self.full_name}' for default '{value}': " + str(error))
 
     def _cmd_flag(self, short=False):
         """ return flag e.g. '--version', '-v' if short == True"""
-        return min(self.flags, key=len) if short else max(self.flags, key=len)
+        return self._short_flag if short else self._long_flag
 
     def cmd(self, obj, short=False):
         """ creates command line part for this argument """
@@ -208,7 +251,10 @@ class Argument(object):
         return f"{self._cmd_flag(short)} {cmd_value}"
 
     def usage(self):
-        usage = self._cmd_flag()
+        return self._usage
+
+    def _make_usage(self):
+        usage = self._long_flag
         if self.many:
             usage = usage + ' ...'
         if not self.required:
@@ -216,6 +262,9 @@ class Argument(object):
         return usage
 
     def option(self):
+        return self._option
+
+    def _make_option(self):
         flags = ', '.join(self.flags)
         type_ = get_type_string(self.type, short=True)
         posit = 'true' if self.positional else 'false'
@@ -233,24 +282,36 @@ class KeywordArguments(Mapping):
      - To enable this usage, all methods, class and other attributes start with an underscore,
     """
     _arguments = None  # overridden in __init_subclass__
+    _default_values = {}  # overridden in __init_subclass__
+
+    __slots__ = ('__arg_values__',)
 
     def __init_subclass__(cls, **kwargs):
         """ mainly initialises the argparse.ArgumentParser and adds arguments to the parser """
         super().__init_subclass__(**kwargs)
+        arguments = dict(cls._arguments or {})  # inherited, validated arguments first
+        arguments.update((n, a) for n, a in vars(cls).items() if isinstance(a, Argument))  # no MRO walk needed
         valid_arguments = {}
-        for name, argument in get_typed_class_attrs(cls, Argument).items():
-            argument.validate_config(existing=valid_arguments)
+        used_flags = set()
+        many_count = 0
+        positional_chain = True
+        for name, argument in arguments.items():
+            argument.validate_config(used_flags=used_flags, many_count=many_count, positional_chain=positional_chain)
             valid_arguments[name] = argument
+            used_flags.update(argument.flags)
+            many_count += bool(argument.many)
+            positional_chain = positional_chain and argument.positional and not argument.switch
         cls._arguments = valid_arguments
+        cls._default_values = {n: a.default for n, a in valid_arguments.items() if a.default is not MISSING}
 
     @classmethod
     def _defaults(cls):
-        return {n: a.default for n, a in cls._arguments.items() if a.default is not MISSING}
+        return dict(cls._default_values)
 
     def __init__(self, **kwargs):
-        self.__arg_values__ = {}
-        self._update(**self._defaults())
-        self._update(**kwargs)
+        self.__arg_values__ = dict(self._default_values)  # defaults were validated in validate_config()
+        if kwargs:
+            self._update(**kwargs)
 
     def __len__(self):
         return len(self.__arg_values__)
@@ -268,8 +329,13 @@ class KeywordArguments(Mapping):
 
     def _update(self, **kwargs):
         """ fills self with values via descriptors """
+        arguments, values = self._arguments, self.__arg_values__
         for name, value in kwargs.items():
-            setattr(self, name, value)
+            argument = arguments.get(name)
+            if argument is not None and value is argument.default and value is not MISSING:
+                values[name] = value  # defaults were validated in validate_config()
+            else:
+                setattr(self, name, value)
 
 
 class CmdParser(object):
@@ -277,11 +343,32 @@ class CmdParser(object):
     This class is the Parser API. Actual parsing takes place in the Kwargs class, where also the parsed values are stored.
     """
     keyword_argument_class = None
+    _flag_lookup = None  # set in __init_subclass__
+    _argument_defs = ()  # set in __init_subclass__
+    _positional_plan = ((), (), ())  # set in __init_subclass__
+    _stripped_doc = ''  # set in __init_subclass__
+    _callable_classes = WeakKeyDictionary()  # func -> parser class, see from_callable()
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__()
         cls.keyword_argument_class = cls._make_keyword_argument_class()
         cls.arguments = cls.keyword_argument_class._arguments  # convenience shortcut
+        cls._flag_lookup = {f: a for a in cls.arguments.values() for f in a.flags}  # flags are fixed from here
+        cls._argument_defs = tuple(cls.arguments.values())  # in definition order, for positional arguments
+        cls._positional_plan = cls._make_positional_plan(cls._argument_defs)
+        cls._stripped_doc = (cls.__doc__ or '').strip()  # for help
+
+    @staticmethod
+    def _make_positional_plan(arg_defs):
+        """
+        Splits argument definitions into those that can take positional values from the left, those from the first
+        up to the last argument with 'many' (only a single one can take the remaining values) and those from the right.
+        """
+        many_indices = [i for i, a in enumerate(arg_defs) if a.many]
+        if not many_indices:
+            return arg_defs, (), ()
+        first, last = many_indices[0], many_indices[-1] + 1
+        return arg_defs[:first], arg_defs[first:last], arg_defs[last:]
 
     @classmethod
     def _make_keyword_argument_class(cls):
@@ -289,18 +376,19 @@ class CmdParser(object):
         arguments = get_typed_class_attrs(cls, Argument)
         for attr_name in arguments:
             delattr(cls, attr_name)  # remove from this class
-        return type(cls.__name__ + 'KeywordArguments', (KeywordArguments,), arguments)
+        return type(cls.__name__ + 'KeywordArguments', (KeywordArguments,), dict(arguments, __slots__=()))
 
     @classmethod
     def _remove_entry_file(cls, cmd_line_list):
-        if len(cmd_line_list):
-            if cmd_line_list[0] in (get_entry_file(path=False),
-                                    get_entry_file(path=True)):
-                del cmd_line_list[0]
+        if cmd_line_list and cmd_line_list[0] in get_entry_files():
+            del cmd_line_list[0]
         return cmd_line_list
 
     @classmethod
     def _normalized_split(cls, cmd_line):
+        head, _, tail = cmd_line.lstrip().partition(' ')
+        if head in get_entry_files():  # strip unquoted entry file before splitting
+            return quote_split(tail)
         return cls._remove_entry_file(quote_split(cmd_line))
 
     @classmethod
@@ -320,6 +408,15 @@ class CmdParser(object):
 
     @classmethod
     def from_callable(cls, func):
+        try:
+            parser_class = cls._callable_classes[func]
+        except KeyError:
+            parser_class = cls._callable_classes[func] = cls._class_from_callable(func)
+        return parser_class(func)  # initialize with func as target
+
+    @staticmethod
+    def _class_from_callable(func):
+        """ creates a parser class from the signature of func, once per func """
         def get_type(p):
             if get_many(p):
                 try:
@@ -348,7 +445,7 @@ class CmdParser(object):
                                        many=get_many(param),
                                        default=get_default(param))
 
-        return type(get_class_name(func), (CmdParser,), arguments)(func)  # create class and initialize with func as target
+        return type(get_class_name(func), (CmdParser,), arguments)
 
     def __init__(self, __target: Callable = None, **sub_parsers: 'CmdParser'):
         self.target = __target  # double underscore to avoid name clashes with **sub_parsers
@@ -370,7 +467,7 @@ class CmdParser(object):
         elif first == '--gui':
             self.gui()
         elif first in self.sub_parsers:
-            self.sub_parsers[first].parse(*cmd_list[1:], run=run)
+            self.sub_parsers[first]._delegate_parse(cmd_list[1:], run)  # already split, no re-join
         else:
             self._parse_command_list(cmd_list)
             if run:
@@ -379,42 +476,55 @@ class CmdParser(object):
 
     def _parse_command_list(self, cmd_list):
         arg_defs = self.arguments
-        flag_lookup = {f: a for a in arg_defs.values() for f in a.flags}
+        flag_lookup = self._flag_lookup
 
         def get_args_kwargs(cmd_list):
             """ gets args and kwargs in encoded (str) form """
-            kwargs = {None: []}  # None key for positional arguments
-            current_name = None  # positionals come first on cmd line
+            args, kwargs = [], {}
+            current = args  # positionals come first on cmd line
+            lookup = flag_lookup.get
             for flag_or_value in cmd_list:
-                if flag_or_value in flag_lookup:  # flag found
-                    current_name = flag_lookup[flag_or_value].name
-                    kwargs[current_name] = []  # stays empty if no values are found
-                else:  # value found
-                    kwargs[current_name].append(flag_or_value)
-            return kwargs.pop(None), kwargs  # args, kwargs
+                arg_def = lookup(flag_or_value)
+                if arg_def is None:  # value found
+                    current.append(flag_or_value)
+                else:  # flag found
+                    current = kwargs[arg_def.name] = []  # stays empty if no values are found
+            return args, kwargs
 
         def get_positional_kwargs(pos_args):
             """ assigns positional string values to arguments """
-            pos_arg_defs = []
-            for name, arg_def in arg_defs.items():
-                if name in kw_args:
-                    break  # break on: first key already present
-                pos_arg_defs.append(arg_def)
-
-            pos_kwargs = {}
-            try:  # note: if len(args) == 0, index error cannot occur
-                while len(pos_args) and not pos_arg_defs[0].many:  # from left
-                    pos_kwargs[pos_arg_defs.pop(0).name] = [pos_args.pop(0)]
-                while len(pos_args) and not pos_arg_defs[-1].many:  # from right
-                    pos_kwargs[pos_arg_defs.pop(-1).name] = [pos_args.pop(-1)]
-            except IndexError:
-                raise ValidationError(f"too many positional arguments found: {cmd_list}")
-
-            if len(pos_args):
-                if len(pos_arg_defs) == 1:  # remaining; only if many is True
-                    pos_kwargs[pos_arg_defs[0].name] = pos_args
-                else:  # either there are 0 or >1 arguments to assign the remaining values to
+            prefix = len(self._argument_defs)
+            for i, arg_def in enumerate(self._argument_defs):
+                if arg_def.name in kw_args:
+                    prefix = i  # up to first key already present
+                    break
+
+            left_defs, many_defs, right_defs = self._positional_plan  # restrict to the first 'prefix' definitions:
+            n_left = min(prefix, len(left_defs))
+            n_many = min(prefix - n_left, len(many_defs))
+            n_right = min(prefix - n_left - n_many, len(right_defs))
+            left_defs, right_defs = left_defs[:n_left], right_defs[:n_right]
+            if 0 < n_many < len(many_defs):  # prefix ends in the 'many' block, trailing definitions now take from right
+                end = n_many
+                while not many_defs[n_many - 1].many:
+                    n_many -= 1
+                right_defs = many_defs[n_many:end]
+            many_defs = many_defs[:n_many]
+
+            count = len(pos_args)
+            n_left = min(count, len(left_defs))  # from left
+            n_right = min(count - n_left, len(right_defs))  # from right
+            pos_kwargs = {a.name: [v] for a, v in zip(left_defs, pos_args[:n_left])}
+            if n_right:
+                pos_kwargs.update({a.name: [v] for a, v in zip(right_defs[-n_right:], pos_args[-n_right:])})
+
+            remaining = pos_args[n_left:count - n_right]
+            if remaining:
+                if not many_defs:
+                    raise ValidationError(f"too many positional arguments found: {cmd_list}")
+                if len(many_defs) > 1:  # cannot decide which argument to assign the values to
                     raise ValidationError(f"some values cannot be assigned to arguments: {cmd_list}")
+                pos_kwargs[many_defs[0].name] = remaining
             return pos_kwargs
 
         args, kw_args = get_args_kwargs(cmd_list)
@@ -457,6 +567,7 @@ class CmdParser(object):
 
     def gui(self):
         """ opens the GUI """
+        from pycicle import cmd_gui  # imported here to keep tkinter out of command line only use
         return cmd_gui.ArgGui(parser=self).mainloop()
 
     def run(self, do_raise=True):
@@ -486,11 +597,10 @@ class CmdParser(object):
             - list: the command is returned  as a list string (with [])
         """
         try:
-            cmds = [arg.cmd(self.keyword_arguments, short) for arg in self.arguments.values()]
+            cmd = ' '.join(filter(None, (arg.cmd(self.keyword_arguments, short) for arg in self._argument_defs)))
         except AttributeError:
             return None
         else:
-            cmd = ' '.join(c for c in cmds if c)
             if self.sub_path:
                 cmd = f"{self.sub_path} {cmd}"
             if file:
@@ -508,24 +618,36 @@ class CmdParser(object):
 
     def help(self):
         """ used by GUI and command line '--help' to show help """
+        return self._help_text
+
+    @cached_property
+    def _help_text(self):
+        """ arguments and sub-parsers are fixed after __init__, so the help text is created once """
         return f"usage: {self._usage_help()}\n\noptions:\n  {self._options_help()}"
 
-    def _usage_help(self, line_start=''):
+    def _usage_help(self, line_start='', parts=None):
         """ usage info similar to other command line parsers """
-        file = '' if line_start else get_entry_file(path=False) + ' '
+        top = parts is None
+        if top:
+            parts = [get_entry_file(path=False) + ' ']
         line_start += '  '
-        usage = f"{file}{' '.join(arg.usage() for arg in self.arguments.values())}"
+        parts.append(' '.join(arg.usage() for arg in self.arguments.values()))
         for name, sub_parser in self.sub_parsers.items():
-            usage += f"\n{line_start}{name}: {sub_parser._usage_help(line_start)}"
-        return usage
+            parts.append(f"\n{line_start}{name}: ")
+            sub_parser._usage_help(line_start, parts)
+        return ''.join(parts) if top else None
 
-    def _options_help(self, line_start=''):
+    def _options_help(self, line_start='', parts=None):
         """ help on options similar to other command line parsers """
+        top = parts is None
+        if top:
+            parts = []
         line_start = f"\n{line_start} "
-        options = line_start + line_start.join(arg.option() for arg in self.arguments.values())
+        parts.append(line_start + line_start.join(arg.option() for arg in self.arguments.values()))
         for name, sub_parser in self.sub_parsers.items():
-            options += f"\n{line_start}{name}:{sub_parser._options_help(line_start)}"
-        return options
+            parts.append(f"\n{line_start}{name}:")
+            sub_parser._options_help(line_start, parts)
+        return ''.join(parts) if top else None
 
 
 if __name__ == '__main__':
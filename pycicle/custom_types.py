@@ -1,3 +1,5 @@
+import os
+
 from pathlib import Path
 
 
@@ -14,17 +16,18 @@ class FileFolderBase(str):
             return super().__new__(cls)
         if ',' in string:
             raise ValueError(f"file or folder '{string}' contains a ','")
-        path = Path(string)
+        path = str(Path(string))  # normalized, e.g. separators
         if cls.existing is True and not cls.does_exist(path):
-            raise ValueError(f"file: {str(path)} does not exist")
+            raise ValueError(f"file: {path} does not exist")
         if cls.existing is False and cls.does_exist(path):
-            raise ValueError(f"file: {str(path)} already exists")
+            raise ValueError(f"file: {path} already exists")
         return super().__new__(cls, path)
 
 
 class FileBase(FileFolderBase):
     extensions = ()  # allowed file extensions
-    does_exist = Path.is_file
+    _extension_set = frozenset()  # for fast lookup, set in __init_subclass__
+    does_exist = staticmethod(os.path.isfile)
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -35,6 +38,7 @@ class FileBase(FileFolderBase):
                 ext = ext[1:]
             extensions.add(ext)
         cls.extensions = tuple(extensions)
+        cls._extension_set = frozenset(extensions)
 
     @classmethod
     def string(cls, short=False):
@@ -50,14 +54,13 @@ class FileBase(FileFolderBase):
             return f"File(existing={cls.existing})"
 
     def __new__(cls, string=''):
-        _, _, ext = string.rpartition('.')
-        if cls.extensions and ext not in cls.extensions:
+        if cls._extension_set and string.rpartition('.')[2] not in cls._extension_set:
             raise ValueError(f"incorrect extension for file: {string}; should be one of {cls.extensions}")
         return super().__new__(cls, string)
 
 
 class FolderBase(FileFolderBase):
-    does_exist = Path.is_dir
+    does_exist = staticmethod(os.path.isdir)
 
     @classmethod
     def string(cls, short=False):
@@ -76,6 +79,7 @@ def Folder(existing=False):
 
 class ChoiceBase(object):
     choices = ()  # defined in def Choice() below
+    _choice_set = frozenset()  # for fast lookup, defined in def Choice() below
 
     @classmethod
     def string(cls, short=False):
@@ -88,7 +92,7 @@ class ChoiceBase(object):
             value = cls.choices[0]
         elif isinstance(value, str):
             value = cls.__bases__[1](value)  # convert to second baseclass == type of choices
-        if value not in cls.choices:
+        if value not in cls._choice_set:
             raise ValueError(f"value '{str(value)}' is not a choice in {cls.choices}")
         return super().__new__(cls, value)
 
@@ -99,7 +103,7 @@ def Choice(*choices):
         raise ValueError(f"cannot define Choice without any choices")
     if any(type(c) is not type(choices[0]) for c in choices):
         raise ValueError(f"all choices must be of same type")
-    return type('Choice', (ChoiceBase, type(choices[0])), {'choices': choices})
+    return type('Choice', (ChoiceBase, type(choices[0])), {'choices': choices, '_choice_set': frozenset(choices)})
 
 
 def get_type_string(type, short=False):
@@ -1,5 +1,7 @@
 import inspect
 
+from functools import lru_cache
+
 from pycicle.tools.utils import MISSING
 from pycicle.tools.document import Document, Chapter, ItemList
 
@@ -67,18 +69,24 @@ str_funcs = dict(
 )
 
 
+@lru_cache(maxsize=256)  # bounded: do not keep every argument ever shown alive
+def get_argument_specs(argument):
+    """ argument configuration is fixed after class creation, so the specs only need to be created once """
+    return {name: func(argument) for name, func in str_funcs.items()}
+
+
 def get_parser_help(parser, **kwargs):
     command_help = f"current: {parser.command(file=True, path=False)}\n\n{parser.help()}"
     chapters = [Chapter('Command Line', content=command_help)(**kwargs)]
     document = Document(title=type(parser).__name__,
-                        intro=type(parser).__doc__.strip(),
+                        intro=parser._stripped_doc,
                         chapters=chapters,
                         extro='More help can be found under the help buttons next to the options.')
     return document(**kwargs)
 
 
 def get_argument_help(argument, error=None, **kwargs):
-    arg_specs = ItemList(items={name: func(argument) for name, func in str_funcs.items()})
+    arg_specs = ItemList(items=get_argument_specs(argument))
     chapters = [Chapter('Help', content=argument.help)(**kwargs),
                 Chapter('Specifications', content=arg_specs(''))(**kwargs)]
     if error:
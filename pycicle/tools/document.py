@@ -1,12 +1,14 @@
 import itertools
 
-long_line = 120 * chr(8254)
-short_line = 80 * chr(8254)
+long_line = 120 * '\u203e'  # chr(8254), overline; folded to a constant at compile time
+short_line = 80 * '\u203e'
 
 
 class BaseString(object):
     template = None
 
+    __slots__ = ()
+
     def __call__(self, *args, **kwargs):
         raise NotImplementedError
 
@@ -14,6 +16,8 @@ class BaseString(object):
 class Document(BaseString):
     template = "\n{title}\n{separator}\n{intro}\n\n{chapters}\n{extro}"
 
+    __slots__ = ('title', 'intro', 'chapters', 'extro')
+
     def __init__(self, title, intro, chapters, extro=None):
         self.title = title
         self.intro = intro
@@ -32,6 +36,8 @@ class Document(BaseString):
 class Chapter(BaseString):
     template = "{name}\n{separator}\n{content}\n"
 
+    __slots__ = ('name', 'content')
+
     def __init__(self, name, content):
         self.name = name
         self.content = content
@@ -45,20 +51,20 @@ class Chapter(BaseString):
 class ItemList(BaseString):
     template = "{intro}:\n{items}\n"
 
+    __slots__ = ('intro', 'items', 'extra')
+
     def __init__(self, intro='', items=(), extra=''):
         self.intro = intro
         self.items = items
         self.extra = extra
 
     def _item_strings(self, bullets):
-        if isinstance(self.items, dict):  # filter out empties before to not have gaps in numbered bullets
-            items = [(k, it) for k, it in self.items.items() if it != '']
-        else:
-            items = [it for it in self.items if it != '']
-
+        """ yields formatted items, empties are filtered out before numbering to not have gaps in the bullets """
         if isinstance(self.items, dict):
-            return [f" {b} {k}:\t{it}" for b, (k, it) in zip(bullets, items)]
-        return [f" {b} {it}" for b, it in zip(bullets, items)]
+            items = ((k, it) for k, it in self.items.items() if it != '')
+            return (f" {b} {k}:\t{it}" for b, (k, it) in zip(bullets, items))
+        items = (it for it in self.items if it != '')
+        return (f" {b} {it}" for b, it in zip(bullets, items))
 
     def __call__(self, start=1):
         if isinstance(start, str):
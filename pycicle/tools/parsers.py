@@ -1,5 +1,7 @@
+import re
+
 from datetime import datetime, timedelta, time, date
-from functools import wraps
+from functools import wraps, lru_cache
 
 from pycicle.tools.utils import TRUE, FALSE
 
@@ -25,67 +27,83 @@ def parse_error(on=True):
     return parse_error
 
 
-def parse_bool(arg,
-               true_set=frozenset((TRUE, 'yes', 'true', 't', 'y', '1')),
-               false_set=frozenset((FALSE, 'no', 'false', 'f', 'n', '0'))):
+_bool_strings = dict.fromkeys((TRUE, 'yes', 'true', 't', 'y', '1'), True)
+_bool_strings.update(dict.fromkeys((FALSE, 'no', 'false', 'f', 'n', '0'), False))
+
+
+def parse_bool(arg):
     if isinstance(arg, (bool, int)):
         return bool(arg)
-    if arg.strip().lower() in true_set:
-        return True
-    if arg.strip().lower() in false_set:
-        return False
-    raise ValueError('Boolean value expected')
+    value = _bool_strings.get(arg)  # fast path for canonical values, no new strings
+    if value is None:
+        value = _bool_strings.get(arg.strip().lower())
+        if value is None:
+            raise ValueError('Boolean value expected')
+    return value
 
 
 def encode_bool(val):
     return TRUE if val else FALSE
 
 
+_datetime_regex = re.compile(r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)', re.ASCII)
+_date_regex = re.compile(r'(\d{4})-(\d\d)-(\d\d)', re.ASCII)
+_time_regex = re.compile(r'(\d\d):(\d\d):(\d\d)', re.ASCII)
+
+
 def encode_datetime(dt):
-    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
 
 
 def parse_datetime(string):
-    return datetime.strptime(string, "%Y-%m-%dT%H:%M:%S")
+    match = _datetime_regex.fullmatch(string)  # fast path, strptime() is slow
+    if match is None:  # let strptime() handle e.g. single digits or raise
+        return datetime.strptime(string, "%Y-%m-%dT%H:%M:%S")
+    return datetime(*map(int, match.groups()))
 
 
 def encode_date(d):
-    return d.strftime("%Y-%m-%d")
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
 
 
 def parse_date(string):
-    return datetime.strptime(string, "%Y-%m-%d").date()
+    match = _date_regex.fullmatch(string)
+    if match is None:
+        return datetime.strptime(string, "%Y-%m-%d").date()
+    return date(*map(int, match.groups()))
 
 
 def encode_time(t, sep=":"):
-    return t.strftime(sep.join(["%H", "%M", "%S"]))
+    return f"{t.hour:02d}{sep}{t.minute:02d}{sep}{t.second:02d}"
 
 
 def parse_time(string):
-    return datetime.strptime(string, "%H:%M:%S").time()
+    match = _time_regex.fullmatch(string)
+    if match is None:
+        return datetime.strptime(string, "%H:%M:%S").time()
+    return time(*map(int, match.groups()))
 
 
 def parse_timedelta(string):
-    h, m, s = [s.strip() for s in string.split(':')]
+    h, _, rest = string.partition(':')
+    m, _, s = rest.partition(':')  # int() and float() ignore surrounding whitespace
     return timedelta(hours=int(h), minutes=int(m), seconds=float(s))
 
 
 def encode_timedelta(td):
-    secs = td.total_seconds()
-    hours, seconds = divmod(secs, 3600)
-    minutes, seconds = divmod(seconds, 60)
-    seconds, secpart = divmod(seconds, 1)
-    h = str(int(hours)).zfill(2)
-    m = str(int(minutes)).zfill(2)
-    s = str(int(seconds)).zfill(2)
-    p = str(secpart).split('.')[1]
-    return f"{h}:{m}:{s}.{p}"
+    micros = td // timedelta(microseconds=1)  # integer arithmetic, no float rounding in the fraction
+    hours, micros = divmod(micros, 3_600_000_000)
+    minutes, micros = divmod(micros, 60_000_000)
+    seconds, micros = divmod(micros, 1_000_000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{micros:06d}"
 
 
 def seconds_to_time_string(seconds):
     if seconds is None:
         return ""
-    return encode_time(seconds_to_time(seconds))
+    m, s = divmod(int(seconds + 0.5), 60)  # as seconds_to_time(), without creating a time object
+    h, m = divmod(m, 60)
+    return f"{h % 24:02d}:{m:02d}:{s:02d}"
 
 
 def seconds_to_time(secs):
@@ -106,13 +124,13 @@ def seconds_to_timedelta_string(seconds):
 def datetime_to_string(dt):
     if dt is None:
         return None
-    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return f"{encode_datetime(dt)}.{dt.microsecond:06d}Z"
 
 
 def short_datetime_to_string(dt):
     if dt is None:
         return None
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    return f"{encode_date(dt)} {encode_time(dt)}"
 
 
 def time_to_string(t):
@@ -122,6 +140,9 @@ def time_to_string(t):
 def string_to_datetime(string):
     if string is None:
         return None
+    match = _datetime_regex.fullmatch(string)
+    if match is not None:  # fast path for the format without fraction
+        return datetime(*map(int, match.groups()))
     try:
         return datetime.strptime(string, "%Y-%m-%dT%H:%M:%S.%fZ")
     except ValueError:
@@ -137,22 +158,26 @@ default_type_codecs = {
 }
 
 
+@lru_cache(maxsize=8)
+def _quote_split_pattern(quote):
+    """ matches a quoted string, an unquoted word or an unmatched quote, in that order """
+    q = re.escape(quote)
+    return re.compile(f'{q}([^{q}]*){q}|([^\\s{q}]+)|({q})')
+
+
 def quote_split(string, quote='"'):
+    if quote not in string:
+        return string.split()  # fast path, nothing quoted
     strings = []
-    after = string
-    while len(after):
-        before, char, after = after.partition(quote)
-        strings.extend(before.split())
-        if char:
-            between, char, after = after.partition(quote)
-            if not char:
-                raise ValueError(f"parsing error in 'quote_split()': unmatched '{quote}' in '{string}'")
-            strings.append(between)
+    for between, word, unmatched in _quote_split_pattern(quote).findall(string):
+        if unmatched:
+            raise ValueError(f"parsing error in 'quote_split()': unmatched '{quote}' in '{string}'")
+        strings.append(word or between)
     return strings
 
 
 def quote_join(strings, quote='"', char=' '):
-    return char.join(quotify(s, quote, char) for s in strings)
+    return char.join([quotify(s, quote, char) for s in strings])
 
 
 def quotify(string, quote='"', char=' '):
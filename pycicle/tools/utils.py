@@ -1,9 +1,8 @@
-import inspect
 import os
 import sys
 import io
 import traceback
-from contextlib import contextmanager
+from functools import lru_cache
 
 MISSING = object()
 TRUE, FALSE = 'true', 'false'
@@ -13,29 +12,44 @@ def traceback_string(exception):
     return ''.join(traceback.format_tb(exception.__traceback__))
 
 
-@contextmanager
-def redirect_output(target=None):
-    target = target or io.StringIO()
-    original = (sys.stdout, sys.stderr)
-    sys.stdout, sys.stderr = (target, target)
-    try:
-        yield target
-    except BaseException as error:
-        target.write(traceback_string(error))
-        raise
-    finally:
-        sys.stdout, sys.stderr = original
-        if hasattr(target, 'close'):
-            target.close()
+class redirect_output(object):
+    """ context manager that redirects stdout and stderr to target (default StringIO), also writes tracebacks """
 
+    def __init__(self, target=None):
+        self.target = target or io.StringIO()
+        self.original = None
 
+    def __enter__(self):
+        self.original = (sys.stdout, sys.stderr)
+        sys.stdout, sys.stderr = (self.target, self.target)
+        return self.target
+
+    def __exit__(self, exc_type, error, tb):
+        if error is not None:
+            self.target.write(traceback_string(error))
+        sys.stdout, sys.stderr = self.original
+        if hasattr(self.target, 'close'):
+            self.target.close()
+        return False  # exceptions are re-raised
+
+
+@lru_cache(maxsize=4)  # the entry file does not change during the lifetime of the process
 def get_entry_file(path=True):
-    file_path = inspect.stack()[-1].filename
+    frame = sys._getframe()
+    while frame.f_back is not None:  # walk to the outermost frame; inspect.stack() also reads source lines
+        frame = frame.f_back
+    file_path = frame.f_code.co_filename
     if path:
         return os.path.abspath(file_path)
     return os.path.basename(file_path)
 
 
+@lru_cache(maxsize=1)
+def get_entry_files():
+    """ the entry file with and without path, e.g. to recognize it at the start of a command line """
+    return frozenset((get_entry_file(path=True), get_entry_file(path=False)))
+
+
 def add_to_module(cls_or_func):
     setattr(sys.modules[cls_or_func.__module__], cls_or_func.__name__, cls_or_func)
     return cls_or_func
@@ -55,22 +69,22 @@ class cached_property(object):
 
     def __init__(self, getter):
         self.getter = getter
+        self.name = getter.__name__
+
+    def __set_name__(self, cls, name):
+        self.name = name
 
     def __get__(self, obj, cls):
         if obj is None:
             return self
-        result = obj.__dict__[self.getter.__name__] = self.getter(obj)
+        result = obj.__dict__[self.name] = self.getter(obj)  # instance dict now shadows this descriptor
         return result
 
 
 
 
 def count(seq, key):
-    counter = 0
-    for s in seq:
-        if key(s):
-            counter += 1
-    return counter
+    return sum(1 for s in seq if key(s))
 
 
 if __name__ == '__main__':
@@ -1,5 +1,7 @@
+import io
 import os
 import unittest
+from contextlib import redirect_stdout
 from datetime import datetime, timedelta, date, time
 from typing import List
 
@@ -16,9 +18,9 @@ class TestArgParser(unittest.TestCase):
         class Parser(CmdParser):
             pass
 
-        Parser().parse('--help')
-        import subprocess
-        subprocess.run(['python', __file__, "--help"])
+        with redirect_stdout(io.StringIO()) as output:
+            Parser().parse('--help')
+        assert output.getvalue().startswith('usage:')
 
     def test_target(self):
         """ test whether target gets called """
@@ -156,7 +158,6 @@ class TestArgParser(unittest.TestCase):
             parser = Parser().parse('-z')
 
     def test_datetime_types_and_defaults(self):
-        from datetime import datetime, time, date, timedelta
 
         class Parser(CmdParser):
             datetime_ = Argument(datetime, default=datetime(1999, 6, 8, 12, 12, 12))
@@ -335,6 +336,15 @@ class TestArgParser(unittest.TestCase):
 
 
 class TestDescriptorConfig(unittest.TestCase):
+    type_values = {bool: (False, True),
+                   int: (-1, 0, 1, 100),
+                   float: (-1.0, 0.0, 1.0, float('inf')),
+                   str: ('', 'a', ' a ab b  ', '\n \t a\nb \t\n '),
+                   datetime: (datetime(1999, 1, 2, 3, 4, 5),),
+                   timedelta: (timedelta(seconds=1000),),
+                   date: (date(1999, 3, 4),),
+                   time: (time(22, 4, 5),)}
+
     @classmethod
     def illegal(cls, kwargs):
         return False
@@ -361,46 +371,30 @@ class TestDescriptorConfig(unittest.TestCase):
                         arg = Argument(**kwargs)
 
     def test_not_many_and_types(self):
-        type_values = {bool: (False, True),
-                       int: (-1, 0, 1, 100),
-                       float: (-1.0, 0.0, 1.0, float('inf')),
-                       str: ('', 'a', ' a ab b  ', '\n \t a\nb \t\n '),
-                       datetime: (datetime(1999, 1, 2, 3, 4, 5),),
-                       timedelta: (timedelta(seconds=1000),),
-                       date: (date(1999, 3, 4),),
-                       time: (time(22, 4, 5),)}
-
-        for type, values in type_values.items():
-            for kwargs in dict_product(type=type, many=False, default=(MISSING, None) + values,
-                                       valid=(lambda v: v <= max(values), None)):
-                if not self.illegal(kwargs):
-                    class Parser(CmdParser):
-                        arg = Argument(**kwargs)
-                else:
-                    with self.assertRaises(ConfigError):
+        for type, values in self.type_values.items():
+            with self.subTest(type=type.__name__):  # reports failures per type
+                for kwargs in dict_product(type=type, many=False, default=(MISSING, None) + values,
+                                           valid=(lambda v: v <= max(values), None)):
+                    if not self.illegal(kwargs):
                         class Parser(CmdParser):
                             arg = Argument(**kwargs)
+                    else:
+                        with self.assertRaises(ConfigError):
+                            class Parser(CmdParser):
+                                arg = Argument(**kwargs)
 
     def test_many_and_types(self):
-        type_values = {bool: (False, True),
-                       int: (-1, 0, 1, 100),
-                       float: (-1.0, 0.0, 1.0, float('inf')),
-                       str: ('', 'a', ' a ab b  ', '\n \t a\nb \t\n '),
-                       datetime: (datetime(1999, 1, 2, 3, 4, 5),),
-                       timedelta: (timedelta(seconds=1000),),
-                       date: (date(1999, 3, 4),),
-                       time: (time(22, 4, 5),)}
-
-        for type, values in type_values.items():
-            for kwargs in dict_product(type=type, many=True, default=(MISSING, None, values),
-                                       valid=(lambda v: len(v) == len(values), None)):
-                if not self.illegal(kwargs):
-                    class Parser(CmdParser):
-                        arg = Argument(**kwargs)
-                else:
-                    with self.assertRaises(ConfigError):
+        for type, values in self.type_values.items():
+            with self.subTest(type=type.__name__):  # reports failures per type
+                for kwargs in dict_product(type=type, many=True, default=(MISSING, None, values),
+                                           valid=(lambda v: len(v) == len(values), None)):
+                    if not self.illegal(kwargs):
                         class Parser(CmdParser):
                             arg = Argument(**kwargs)
+                    else:
+                        with self.assertRaises(ConfigError):
+                            class Parser(CmdParser):
+                                arg = Argument(**kwargs)
 
     def test_validation(self):
         """ very basic but a lot of combinations, mainly aiming for default validation """
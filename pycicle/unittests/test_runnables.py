@@ -1,12 +1,15 @@
 import os
+import sys
 import unittest
 import subprocess
 
+runnables_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runnables')
+
 
 class TestArgParser(unittest.TestCase):
 
     def run_command(self, file, cmd):
-        p = subprocess.Popen(['python', __file__ + f'/../runnables/{file}', *cmd.split(' ')],
+        p = subprocess.Popen([sys.executable, os.path.join(runnables_folder, file), *cmd.split(' ')],
                              stdout=subprocess.PIPE)
         output, _ = p.communicate()
         return output.decode("utf-8")[:-2]  # remove '\r\n'
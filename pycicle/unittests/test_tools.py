@@ -10,19 +10,22 @@ class TestTools(unittest.TestCase):
         evil_strings = ['"', '"""', 'a" b', ' a " b""', '"'"'"'']
 
         for string in good_strings:
-            decoded = quote_split(string)
-            recoded = quote_join(decoded)
-            assert string == recoded
+            with self.subTest(good=string):
+                decoded = quote_split(string)
+                recoded = quote_join(decoded)
+                assert string == recoded
 
         for string in diff_strings:
-            recoded = quote_join(quote_split(string))
-            decoded = quote_split(recoded)
-            rerecoded = quote_join(decoded)
-            assert rerecoded == recoded
+            with self.subTest(diff=string):
+                recoded = quote_join(quote_split(string))
+                decoded = quote_split(recoded)
+                rerecoded = quote_join(decoded)
+                assert rerecoded == recoded
 
         for string in evil_strings:
-            with self.assertRaises(ValueError):
-                quote_split(string)
+            with self.subTest(evil=string):
+                with self.assertRaises(ValueError):
+                    quote_split(string)
 
 
 
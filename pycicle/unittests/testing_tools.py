@@ -4,45 +4,48 @@ from pycicle.tools.parsers import quote_join
 
 
 def yielder(arg):
-    if isinstance(arg, str):
+    if isinstance(arg, str):  # strings are single values, not iterated
         yield arg
-    try:
+    elif hasattr(type(arg), '__iter__'):  # no exception for scalars (or classes, e.g. 'int')
         yield from arg
-    except TypeError:
+    else:
         yield arg
 
 
 def dict_product(**iterators):
-    iterators = {n: yielder(it) for n, it in iterators.items()}
-    names = list(iterators)
-    for values in product(*iterators.values()):
+    names = tuple(iterators)
+    value_lists = [tuple(yielder(it)) for it in iterators.values()]  # materialized once
+    for values in product(*value_lists):
         yield dict(zip(names, values))
 
 
-def make_test_command(parser_class, kwargs, short=False):
-    """ somewhat more limited then real function """
+def _create_value(arg, value):
+    if isinstance(value, (list, tuple)):
+        return quote_join(map(arg._encode, value))
+    return arg.encode(value)
 
-    def create_value(arg, value):
-        if isinstance(value, (list, tuple)):
-            return quote_join(arg._encode(v) for v in value)
-        return arg.encode(value)
 
-    cmd = ''
+def make_test_command(parser_class, kwargs, short=False):
+    """ somewhat more limited then real function """
+    arguments = parser_class.arguments
+    parts = []
     for name, value in kwargs.items():
-        arg = getattr(parser_class.keyword_argument_class, name)
-        value = create_value(arg, value)
+        arg = arguments[name]
+        value = _create_value(arg, value)
         if short:
             if arg.positional:
-                cmd = cmd + f" {value}"
+                parts.append(value)
             else:
-                cmd = cmd + f" -{name[0]} {value}"  # can create doubles
+                parts.append(f"-{name[0]} {value}")  # can create doubles
         else:
-            cmd = cmd + f" --{name} {value}"
-    return cmd.strip()
+            parts.append(f"--{name} {value}")
+    return ' '.join(parts).strip()
 
 
 def args_asserter(**expected):
     def do_assert(**created):
+        if created == expected:  # fast path, the checks below only create a clear message
+            return
         if len(expected) != len(created):
             raise AssertionError(f"incorrect number of arguments: {len(created)} != {len(expected)}")
         for name, value in expected.items():